@@ -6,430 +6,377 @@ and saves them in the docs/ directory with a table of contents sidebar.
 """
 
 import os
-import markdown
 import glob
+import shutil
 from pathlib import Path
 import re
-
-
-def extract_toc_from_markdown(markdown_content):
-    """
-    Extract table of contents from markdown content by finding headers
-    """
-    toc = []
-    # Regex to find headers in markdown
-    header_pattern = r'^(#{1,6})\s+(.*)'
-
-    lines = markdown_content.split('\n')
-    for line in lines:
-        match = re.match(header_pattern, line.strip())
-        if match:
-            level = len(match.group(1))  # Number of # indicates header level
-            title = match.group(2).strip()
-
-            # Create slug for anchor link (convert spaces to hyphens, remove special chars)
-            slug = re.sub(r'[^\w\s-]', '', title.lower()).strip().replace(' ', '-')
-
-            toc.append({
-                'level': level,
-                'title': title,
-                'slug': slug
-            })
-
-    return toc
-
-
-def generate_sidebar_toc(toc):
-    """
-    Generate HTML sidebar TOC based on extracted TOC
-    """
-    if not toc:
-        return "<p>No table of contents available</p>"
-
-    html = '<div class="toc-title">Contents</div>\n<ul class="toc-list">\n'
-
-    current_level = 1
-    for item in toc:
-        level = item['level']
-
-        # Adjust nesting based on level
-        if level > current_level:
-            # Open nested lists
-            for _ in range(level - current_level):
-                html += '    <ul class="nested-toc">\n'
-        elif level < current_level:
-            # Close nested lists
-            for _ in range(current_level - level):
-                html += '    </ul>\n</li>\n'
-
-        # Add list item
-        html += f'    <li><a href="#{item["slug"]}">{item["title"]}</a>'
-
-        current_level = level
-
-    # Close any remaining nested lists
-    for _ in range(current_level - 1):
-        html += '    </ul>\n</li>\n'
-    html += '</li>\n</ul>\n'
-
-    return html
-
-
-def convert_markdown_to_html(input_file, output_dir):
-    """
-    Convert a single markdown file to HTML with a responsive template and TOC sidebar
-    """
-
-    # Read the markdown file
-    with open(input_file, 'r', encoding='utf-8') as f:
-        markdown_content = f.read()
-
-    # Extract TOC before converting to HTML
-    toc = extract_toc_from_markdown(markdown_content)
-
-    # Convert markdown to HTML
-    md = markdown.Markdown(extensions=[
-        'tables',
-        'fenced_code',
-        'toc',
-        'codehilite'
-    ])
-    html_body = md.convert(markdown_content)
-
-    # Extract title from the first heading
-    title_match = re.match(r'^#\s+(.+)', markdown_content, re.MULTILINE)
-    if title_match:
-        title = title_match.group(1)
-    else:
-        title = Path(input_file).stem.replace('_', ' ').title()
-
-    # Generate the sidebar TOC
-    sidebar_content = generate_sidebar_toc(toc)
-
-    # Create the complete HTML document with responsive template and sidebar
-    html_template = f"""<!DOCTYPE html>
+import json
+import hashlib
+import html
+from functools import lru_cache
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from toc_utils import TocItem, add_heading_ids, generate_sidebar_toc
+
+try:
+    import pyromark
+except ImportError:
+    # Fall back to python-markdown (imported lazily) when pyromark isn't installed
+    pyromark = None
+
+# pulldown-cmark features matching the python-markdown extensions used previously
+PYROMARK_OPTIONS = (
+    pyromark.Options.ENABLE_TABLES
+    | pyromark.Options.ENABLE_STRIKETHROUGH
+    | pyromark.Options.ENABLE_FOOTNOTES
+) if pyromark else None
+
+# Regexes are compiled once here and shared by all functions
+TEMPLATE_PLACEHOLDER_RE = re.compile(r'\{(title|html_body|date|sidebar)\}')
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+CSS_PUNCTUATION_RE = re.compile(r'\s*([{}:;,])\s*')
+WHITESPACE_RE = re.compile(r'\s+')
+LEADING_INDENT_RE = re.compile(r'^[ \t]+', re.M)
+
+# Build date shown in the page footer (YYYY-MM-DD), computed once per run
+CURRENT_DATE = datetime.now().strftime("%Y-%m-%d")
+
+# Incremental build cache kept in the output directory
+BUILD_CACHE_FILE = '.build_cache.json'
+
+# Stylesheet shared by all generated pages, written once per run next to them
+PAGE_CSS = """/* CSS Reset */
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+/* Main styles */
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Open Sans', 'Helvetica Neue', sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background-color: #f8f9fa;
+    padding: 0;
+    margin: 0;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+    min-height: 100vh;
+    display: flex;
+    gap: 20px;
+}
+
+.main-content {
+    flex: 1;
+    background-color: white;
+    padding: 30px;
+    border-radius: 8px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+
+.sidebar {
+    width: 300px;
+    background-color: white;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    align-self: flex-start;
+    position: sticky;
+    top: 20px;
+    max-height: calc(100vh - 40px);
+    overflow-y: auto;
+}
+
+.toc-title {
+    font-size: 1.2rem;
+    font-weight: bold;
+    margin-bottom: 1rem;
+    color: #2c3e50;
+    border-bottom: 2px solid #3498db;
+    padding-bottom: 0.5rem;
+}
+
+.toc-list {
+    list-style-type: none;
+    padding-left: 0;
+}
+
+.toc-list li {
+    margin-bottom: 0.5rem;
+}
+
+.toc-list a {
+    color: #2980b9;
+    text-decoration: none;
+    display: block;
+    /* padding: 0.25rem 0.5rem; */ 
+    border-radius: 4px;
+    transition: all 0.2s;
+}
+
+.toc-list a:hover {
+    background-color: #e3f2fd;
+    color: #1a5ca3;
+    padding-left: 0.75rem;
+}
+
+.nested-toc {
+    padding-left: 1rem;
+    margin-top: 0.25rem;
+}
+
+header {
+    background-color: #2c3e50;
+    color: white;
+    padding: 1rem;
+    border-radius: 6px;
+    margin-bottom: 20px;
+}
+
+.header-content {
+    max-width: 1200px;
+    margin: 0 auto;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+h1 {
+    font-size: 1.8rem;
+    margin-bottom: 0;
+}
+
+nav ul {
+    list-style: none;
+    display: flex;
+    gap: 1rem;
+}
+
+nav a {
+    color: white;
+    text-decoration: none;
+    padding: 0.5rem;
+    border-radius: 4px;
+    transition: background-color 0.2s;
+}
+
+nav a:hover {
+    background-color: #34495e;
+}
+
+.main-content_area {
+    padding: 1rem 0;
+}
+
+/* Markdown content styling */
+.markdown-body {
+    max-width: 100%;
+}
+
+.markdown-body h1, .markdown-body h2, .markdown-body h3, .markdown-body h4, .markdown-body h5, .markdown-body h6 {
+    margin-top: 1.5rem;
+    margin-bottom: 1rem;
+    color: #2c3e50;
+}
+
+.markdown-body h1 {
+    font-size: 2.2rem;
+    border-bottom: 2px solid #eee;
+    padding-bottom: 0.5rem;
+}
+
+.markdown-body h2 {
+    font-size: 1.8rem;
+    border-bottom: 1px solid #eee;
+    padding-bottom: 0.3rem;
+}
+
+.markdown-body h3 {
+    font-size: 1.5rem;
+}
+
+.markdown-body p {
+    margin-bottom: 1rem;
+}
+
+.markdown-body ul, .markdown-body ol {
+    margin-left: 1.5rem;
+    margin-bottom: 1rem;
+}
+
+.markdown-body li {
+    margin-bottom: 0.5rem;
+}
+
+.markdown-body a {
+    color: #3498db;
+    text-decoration: none;
+}
+
+.markdown-body a:hover {
+    text-decoration: underline;
+}
+
+.markdown-body img {
+    max-width: 100%;
+    height: auto;
+}
+
+.markdown-body table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 1rem 0;
+}
+
+.markdown-body th, .markdown-body td {
+    border: 1px solid #ddd;
+    padding: 0.75rem;
+    text-align: left;
+}
+
+.markdown-body th {
+    background-color: #f2f2f2;
+    font-weight: bold;
+}
+
+.markdown-body tr:nth-child(even) {
+    background-color: #f9f9f9;
+}
+
+.markdown-body code {
+    background-color: #f4f4f4;
+    padding: 0.2rem 0.4rem;
+    border-radius: 3px;
+    font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+}
+
+.markdown-body pre {
+    background-color: #2d3748;
+    color: #e2e8f0;
+    padding: 1rem;
+    border-radius: 5px;
+    overflow-x: auto;
+    margin: 1rem 0;
+}
+
+.markdown-body pre code {
+    background: none;
+    padding: 0;
+    color: inherit;
+}
+
+.markdown-body blockquote {
+    border-left: 4px solid #3498db;
+    padding-left: 1rem;
+    margin: 1rem 0;
+    color: #666;
+    font-style: italic;
+    background-color: #f8f9fa;
+    border-radius: 0 4px 4px 0;
+}
+
+.markdown-body hr {
+    border: 0;
+    border-top: 1px solid #eee;
+    margin: 2rem 0;
+}
+
+footer {
+    text-align: center;
+    padding: 2rem 0 1rem;
+    color: #7f8c8d;
+    font-size: 0.9rem;
+    margin-top: 2rem;
+    border-top: 1px solid #eee;
+}
+
+/* GitHub corner styling */
+.github-corner {
+    position: fixed;
+    top: 0;
+    right: 0;
+    z-index: 1000;
+}
+
+.github-corner:hover .octo-arm {
+    animation: octocat-wave 560ms ease-in-out;
+}
+
+@keyframes octocat-wave {
+    0%,100% { transform: rotate(0); }
+    20%,60% { transform: rotate(-25deg); }
+    40%,80% { transform: rotate(10deg); }
+}
+
+@media (max-width: 500px) {
+    .github-corner:hover .octo-arm {
+        animation: none;
+    }
+
+    .github-corner .octo-arm {
+        animation: octocat-wave 560ms ease-in-out;
+    }
+}
+
+/* Responsive design */
+@media (max-width: 1024px) {
+    .container {
+        flex-direction: column;
+    }
+
+    .sidebar {
+        width: 100%;
+        max-height: none;
+        margin-top: 20px;
+        position: static;
+    }
+
+    .main-content {
+        padding: 20px;
+    }
+}
+
+@media (max-width: 768px) {
+    .container {
+        padding: 10px;
+    }
+
+    .header-content {
+        flex-direction: column;
+        gap: 1rem;
+    }
+
+    nav ul {
+        flex-wrap: wrap;
+        justify-content: center;
+    }
+
+    .main-content {
+        padding: 15px;
+    }
+}
+"""
+# Minified once at import: drop comments, collapse whitespace, tighten punctuation
+PAGE_CSS_MIN = CSS_PUNCTUATION_RE.sub(
+    r'\1', WHITESPACE_RE.sub(' ', CSS_COMMENT_RE.sub('', PAGE_CSS))
+).strip()
+# Content-hashed filename so browsers pick up stylesheet changes
+STYLESHEET_FILE = f"style.{hashlib.blake2b(PAGE_CSS_MIN.encode('utf-8')).hexdigest()[:8]}.css"
+
+# Responsive page template with TOC sidebar; {name} placeholders are filled per file
+HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title} - Fuzzing Tutorial</title>
-    <style>
-        /* CSS Reset */
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        /* Main styles */
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Open Sans', 'Helvetica Neue', sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background-color: #f8f9fa;
-            padding: 0;
-            margin: 0;
-        }}
-
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            min-height: 100vh;
-            display: flex;
-            gap: 20px;
-        }}
-
-        .main-content {{
-            flex: 1;
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-
-        .sidebar {{
-            width: 300px;
-            background-color: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            align-self: flex-start;
-            position: sticky;
-            top: 20px;
-            max-height: calc(100vh - 40px);
-            overflow-y: auto;
-        }}
-
-        .toc-title {{
-            font-size: 1.2rem;
-            font-weight: bold;
-            margin-bottom: 1rem;
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 0.5rem;
-        }}
-
-        .toc-list {{
-            list-style-type: none;
-            padding-left: 0;
-        }}
-
-        .toc-list li {{
-            margin-bottom: 0.5rem;
-        }}
-
-        .toc-list a {{
-            color: #2980b9;
-            text-decoration: none;
-            display: block;
-            /* padding: 0.25rem 0.5rem; */ 
-            border-radius: 4px;
-            transition: all 0.2s;
-        }}
-
-        .toc-list a:hover {{
-            background-color: #e3f2fd;
-            color: #1a5ca3;
-            padding-left: 0.75rem;
-        }}
-
-        .nested-toc {{
-            padding-left: 1rem;
-            margin-top: 0.25rem;
-        }}
-
-        header {{
-            background-color: #2c3e50;
-            color: white;
-            padding: 1rem;
-            border-radius: 6px;
-            margin-bottom: 20px;
-        }}
-
-        .header-content {{
-            max-width: 1200px;
-            margin: 0 auto;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-
-        h1 {{
-            font-size: 1.8rem;
-            margin-bottom: 0;
-        }}
-
-        nav ul {{
-            list-style: none;
-            display: flex;
-            gap: 1rem;
-        }}
-
-        nav a {{
-            color: white;
-            text-decoration: none;
-            padding: 0.5rem;
-            border-radius: 4px;
-            transition: background-color 0.2s;
-        }}
-
-        nav a:hover {{
-            background-color: #34495e;
-        }}
-
-        .main-content_area {{
-            padding: 1rem 0;
-        }}
-
-        /* Markdown content styling */
-        .markdown-body {{
-            max-width: 100%;
-        }}
-
-        .markdown-body h1, .markdown-body h2, .markdown-body h3, .markdown-body h4, .markdown-body h5, .markdown-body h6 {{
-            margin-top: 1.5rem;
-            margin-bottom: 1rem;
-            color: #2c3e50;
-        }}
-
-        .markdown-body h1 {{
-            font-size: 2.2rem;
-            border-bottom: 2px solid #eee;
-            padding-bottom: 0.5rem;
-        }}
-
-        .markdown-body h2 {{
-            font-size: 1.8rem;
-            border-bottom: 1px solid #eee;
-            padding-bottom: 0.3rem;
-        }}
-
-        .markdown-body h3 {{
-            font-size: 1.5rem;
-        }}
-
-        .markdown-body p {{
-            margin-bottom: 1rem;
-        }}
-
-        .markdown-body ul, .markdown-body ol {{
-            margin-left: 1.5rem;
-            margin-bottom: 1rem;
-        }}
-
-        .markdown-body li {{
-            margin-bottom: 0.5rem;
-        }}
-
-        .markdown-body a {{
-            color: #3498db;
-            text-decoration: none;
-        }}
-
-        .markdown-body a:hover {{
-            text-decoration: underline;
-        }}
-
-        .markdown-body img {{
-            max-width: 100%;
-            height: auto;
-        }}
-
-        .markdown-body table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 1rem 0;
-        }}
-
-        .markdown-body th, .markdown-body td {{
-            border: 1px solid #ddd;
-            padding: 0.75rem;
-            text-align: left;
-        }}
-
-        .markdown-body th {{
-            background-color: #f2f2f2;
-            font-weight: bold;
-        }}
-
-        .markdown-body tr:nth-child(even) {{
-            background-color: #f9f9f9;
-        }}
-
-        .markdown-body code {{
-            background-color: #f4f4f4;
-            padding: 0.2rem 0.4rem;
-            border-radius: 3px;
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-        }}
-
-        .markdown-body pre {{
-            background-color: #2d3748;
-            color: #e2e8f0;
-            padding: 1rem;
-            border-radius: 5px;
-            overflow-x: auto;
-            margin: 1rem 0;
-        }}
-
-        .markdown-body pre code {{
-            background: none;
-            padding: 0;
-            color: inherit;
-        }}
-
-        .markdown-body blockquote {{
-            border-left: 4px solid #3498db;
-            padding-left: 1rem;
-            margin: 1rem 0;
-            color: #666;
-            font-style: italic;
-            background-color: #f8f9fa;
-            border-radius: 0 4px 4px 0;
-        }}
-
-        .markdown-body hr {{
-            border: 0;
-            border-top: 1px solid #eee;
-            margin: 2rem 0;
-        }}
-
-        footer {{
-            text-align: center;
-            padding: 2rem 0 1rem;
-            color: #7f8c8d;
-            font-size: 0.9rem;
-            margin-top: 2rem;
-            border-top: 1px solid #eee;
-        }}
-
-        /* GitHub corner styling */
-        .github-corner {{
-            position: fixed;
-            top: 0;
-            right: 0;
-            z-index: 1000;
-        }}
-
-        .github-corner:hover .octo-arm {{
-            animation: octocat-wave 560ms ease-in-out;
-        }}
-
-        @keyframes octocat-wave {{
-            0%,100% {{ transform: rotate(0); }}
-            20%,60% {{ transform: rotate(-25deg); }}
-            40%,80% {{ transform: rotate(10deg); }}
-        }}
-
-        @media (max-width: 500px) {{
-            .github-corner:hover .octo-arm {{
-                animation: none;
-            }}
-
-            .github-corner .octo-arm {{
-                animation: octocat-wave 560ms ease-in-out;
-            }}
-        }}
-
-        /* Responsive design */
-        @media (max-width: 1024px) {{
-            .container {{
-                flex-direction: column;
-            }}
-
-            .sidebar {{
-                width: 100%;
-                max-height: none;
-                margin-top: 20px;
-                position: static;
-            }}
-
-            .main-content {{
-                padding: 20px;
-            }}
-        }}
-
-        @media (max-width: 768px) {{
-            .container {{
-                padding: 10px;
-            }}
-
-            .header-content {{
-                flex-direction: column;
-                gap: 1rem;
-            }}
-
-            nav ul {{
-                flex-wrap: wrap;
-                justify-content: center;
-            }}
-
-            .main-content {{
-                padding: 15px;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="{stylesheet}">
 </head>
 <body>
     <a href="https://github.com/secnotes/fuzzing-tutorial" class="github-corner" aria-label="View source on GitHub">
@@ -462,18 +409,91 @@ def convert_markdown_to_html(input_file, output_dir):
 
             <footer>
                 <p>Fuzzing Tutorial - Collection of Papers, Blogs, and Tools Related to Fuzzing</p>
-                <p>Last updated: {get_current_date()}</p>
+                <p>Last updated: {date}</p>
             </footer>
         </div>
 
         <aside class="sidebar">
-            {sidebar_content}
+            {sidebar}
         </aside>
     </div>
 </body>
 </html>"""
+# Alternating literal chunks and placeholder names, split once at import
+HTML_TEMPLATE_PARTS = TEMPLATE_PLACEHOLDER_RE.split(
+    LEADING_INDENT_RE.sub('', HTML_TEMPLATE).replace('{stylesheet}', STYLESHEET_FILE)
+)
+# Literal chunks are encoded once so writing a page only encodes the per-file values
+HTML_TEMPLATE_PARTS[0::2] = [part.encode('utf-8') for part in HTML_TEMPLATE_PARTS[0::2]]
+
+# Cached outputs are only reused while this script (template), toc_utils.py
+# (TOC rendering) and the markdown renderer stay the same
+TEMPLATE_VERSION = hashlib.blake2b(
+    Path(__file__).read_bytes()
+    + Path(__file__).with_name('toc_utils.py').read_bytes()
+    + (f'pyromark {pyromark.__version__}' if pyromark else 'markdown').encode('utf-8'),
+    digest_size=8
+).hexdigest()
+
+
+def write_html_template(output_file, values):
+    """
+    Stream the page template to output_file, filling placeholders with the given values
+    """
+    with open(output_file, 'wb') as f:
+        f.write(HTML_TEMPLATE_PARTS[0])
+        for name, literal in zip(HTML_TEMPLATE_PARTS[1::2], HTML_TEMPLATE_PARTS[2::2]):
+            f.write(values[name].encode('utf-8'))
+            f.write(literal)
 
-    # Generate output filename
+
+@lru_cache(maxsize=None)
+def get_markdown_converter():
+    """
+    Create the python-markdown converter once per process; it is reset between files
+    """
+    import markdown
+    return markdown.Markdown(extensions=[
+        'tables',
+        'fenced_code',
+        'toc',
+        'codehilite'
+    ])
+
+
+def flatten_toc_tokens(tokens):
+    """
+    Flatten python-markdown's nested toc_tokens into TocItem entries
+    """
+    toc = []
+    for token in tokens:
+        toc.append(TocItem(token['level'], html.unescape(token['name']), token['id']))
+        toc.extend(flatten_toc_tokens(token['children']))
+    return toc
+
+
+def render_markdown(markdown_content):
+    """
+    Render markdown to HTML, using pyromark when available and python-markdown otherwise.
+    The table of contents is collected from the headings the renderer produced,
+    rather than by a separate scan of the markdown source.
+    Returns the HTML body and the TOC.
+    """
+    if pyromark is None:
+        md = get_markdown_converter().reset()
+        html_body = md.convert(markdown_content)
+        return html_body, flatten_toc_tokens(md.toc_tokens)
+
+    # pulldown-cmark doesn't generate heading ids, so add them while collecting the TOC
+    return add_heading_ids(pyromark.html(markdown_content, options=PYROMARK_OPTIONS))
+
+
+def convert_markdown_to_html(input_file, output_dir, cache_entry=None):
+    """
+    Convert a single markdown file to HTML with a responsive template and TOC sidebar.
+    The conversion is skipped when cache_entry shows the input is unchanged since
+    the last build. Returns the output file and its new build cache entry.
+    """
 
     # Generate output filename
     filename = Path(input_file).stem
@@ -486,24 +506,99 @@ def convert_markdown_to_html(input_file, output_dir):
 
     output_file = os.path.join(output_dir, f"{filename}.html")
 
-    # Write the HTML file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_template)
+    # Skip unchanged inputs: same mtime, or failing that the same content hash
+    mtime = os.stat(input_file).st_mtime_ns
+    if cache_entry and not (cache_entry['output'] == output_file and os.path.exists(output_file)):
+        cache_entry = None
+    if cache_entry and cache_entry['mtime'] == mtime:
+        print(f"Skipped unchanged {input_file}")
+        return output_file, cache_entry
+
+    # Read the markdown file
+    with open(input_file, 'rb') as f:
+        raw = f.read()
+
+    key = hashlib.blake2b(raw).hexdigest()
+    new_cache_entry = {'mtime': mtime, 'key': key, 'output': output_file}
+    if cache_entry and cache_entry['key'] == key:
+        print(f"Skipped unchanged {input_file}")
+        return output_file, new_cache_entry
+
+    # Normalize line endings the way text-mode reads do
+    markdown_content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+    # Convert markdown to HTML, collecting the TOC from its headings
+    html_body, toc = render_markdown(markdown_content)
+
+    # Extract title from the first heading, falling back to the file name
+    title = next((item.title for item in toc if item.level == 1), None)
+    if not title:
+        title = Path(input_file).stem.replace('_', ' ').title()
+
+    # Generate the sidebar TOC
+    sidebar_content = generate_sidebar_toc(toc)
+
+    # Write the HTML document with responsive template and sidebar chunk by chunk
+    write_html_template(output_file, {
+        'title': html.escape(title, quote=False),
+        'html_body': html_body,
+        'date': CURRENT_DATE,
+        'sidebar': sidebar_content,
+    })
 
     print(f"Converted {input_file} -> {output_file}")
-    return output_file
+    return output_file, new_cache_entry
 
 
-def get_current_date():
-    """Get current date in YYYY-MM-DD format"""
-    from datetime import datetime
-    return datetime.now().strftime("%Y-%m-%d")
+def load_build_cache(output_dir):
+    """
+    Load the per-file build cache, discarding it if the template version changed
+    """
+    try:
+        with open(os.path.join(output_dir, BUILD_CACHE_FILE), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if cache.get('version') != TEMPLATE_VERSION:
+        return {}
+    return cache.get('files', {})
+
+
+def save_build_cache(output_dir, files):
+    """Save the per-file build cache for the next run"""
+    with open(os.path.join(output_dir, BUILD_CACHE_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'version': TEMPLATE_VERSION, 'files': files}, f, indent=2, sort_keys=True)
+
+
+def write_stylesheet(output_dir):
+    """Write the shared page stylesheet, removing stylesheets from older builds"""
+    for entry in glob.glob(os.path.join(output_dir, 'style.*.css')):
+        if os.path.basename(entry) != STYLESHEET_FILE:
+            os.remove(entry)
+
+    stylesheet = os.path.join(output_dir, STYLESHEET_FILE)
+    if not os.path.exists(stylesheet):
+        with open(stylesheet, 'w', encoding='utf-8') as f:
+            f.write(PAGE_CSS_MIN)
+
+
+def link_or_copy(source, dest):
+    """Hardlink source to dest when possible, falling back to a full copy"""
+    if os.path.exists(dest):
+        if os.path.samefile(source, dest):
+            return
+        os.remove(dest)
+
+    try:
+        os.link(source, dest)
+    except OSError:
+        # Different filesystem or no hardlink support
+        shutil.copy2(source, dest)
 
 
 def copy_logo_if_exists():
     """Copy logo from root logo directory to docs/logo directory if it exists"""
-    import shutil
-    import os
 
     source_logo = "logo/logo.png"
     dest_dir = "docs/logo"
@@ -515,7 +610,7 @@ def copy_logo_if_exists():
     # Copy logo file if it exists
     if os.path.exists(source_logo):
         try:
-            shutil.copy2(source_logo, dest_logo)
+            link_or_copy(source_logo, dest_logo)
             print(f"Copied logo from {source_logo} to {dest_logo}")
         except Exception as e:
             print(f"Error copying logo: {str(e)}")
@@ -529,11 +624,17 @@ def main():
     # Create docs directory if it doesn't exist
     os.makedirs('docs', exist_ok=True)
 
+    # Write the stylesheet shared by all pages
+    write_stylesheet('docs')
+
     # Copy logo if it exists
     copy_logo_if_exists()
 
     # Find all markdown files in the root directory
-    markdown_files = glob.glob("*.md")
+    markdown_files = [
+        entry.name for entry in os.scandir('.')
+        if entry.name.endswith('.md') and not entry.name.startswith('.') and entry.is_file()
+    ]
 
     if not markdown_files:
         print("No markdown files found in the current directory.")
@@ -541,12 +642,27 @@ def main():
 
     print(f"Found {len(markdown_files)} markdown files to convert...")
 
-    # Convert each markdown file to HTML
-    for md_file in markdown_files:
-        try:
-            convert_markdown_to_html(md_file, 'docs')
-        except Exception as e:
-            print(f"Error converting {md_file}: {str(e)}")
+    build_cache = load_build_cache('docs')
+    new_build_cache = {}
+
+    # Convert the markdown files to HTML in parallel; each file is independent
+    with ProcessPoolExecutor() as executor:
+        futures = {
+            executor.submit(convert_markdown_to_html, md_file, 'docs', build_cache.get(md_file)): md_file
+            for md_file in markdown_files
+        }
+        for future in as_completed(futures):
+            try:
+                _, new_build_cache[futures[future]] = future.result()
+            except Exception as e:
+                print(f"Error converting {futures[future]}: {str(e)}")
+
+    # Only rewrite the cache when an input changed, so that a no-op run (e.g. a
+    # fresh checkout where just the mtimes differ) leaves docs/ untouched
+    old_keys = {name: entry['key'] for name, entry in build_cache.items()}
+    new_keys = {name: entry['key'] for name, entry in new_build_cache.items()}
+    if new_keys != old_keys:
+        save_build_cache('docs', new_build_cache)
 
     print("\\nConversion complete! HTML files saved in the 'docs/' directory.")
 
@@ -0,0 +1,110 @@
+"""
+Table of contents helpers for markdown_to_html.py.
+
+These are the per-header loops of the conversion, kept in their own fully
+annotated module so they can optionally be compiled to a C extension with
+mypyc (``pip install mypy && mypyc toc_utils.py``). The compiled module is
+picked up automatically when present; otherwise this file is used as-is.
+"""
+
+import html
+import re
+from typing import List, NamedTuple, Set, Tuple
+
+
+class TocItem(NamedTuple):
+    """One table of contents entry per markdown header"""
+    level: int
+    title: str
+    slug: str
+
+
+# Headings as rendered by pulldown-cmark, which never adds attributes to them
+HEADING_RE = re.compile(r'<h([1-6])>(.*?)</h\1>', re.S)
+TAG_RE = re.compile(r'<[^>]+>')
+SLUG_RE = re.compile(r'[^\w\s-]')
+
+# Deletion table equivalent to SLUG_RE for ASCII text, used for the common case
+SLUG_TABLE = {c: None for c in range(128) if SLUG_RE.match(chr(c))}
+
+HEADING_HTML = '<h{0} id="{1}">{2}</h{0}>'.format
+TOC_ITEM_HTML = '    <li><a href="#{}">{}</a>'.format
+TOC_NESTED_OPEN = '    <ul class="nested-toc">\n'
+TOC_NESTED_CLOSE = '    </ul>\n</li>\n'
+
+
+def heading_slug(title: str) -> str:
+    """
+    Create slug for anchor link (convert spaces to hyphens, remove special chars)
+    """
+    slug = title.lower()
+    if slug.isascii():
+        slug = slug.translate(SLUG_TABLE)
+    else:
+        slug = SLUG_RE.sub('', slug)
+    return slug.strip().replace(' ', '-')
+
+
+def add_heading_ids(html_body: str) -> Tuple[str, List[TocItem]]:
+    """
+    Give every rendered heading an anchor id, collecting the table of contents
+    from the headings in the same pass. Repeated slugs get a _1, _2, ... suffix
+    like python-markdown's toc extension, so every sidebar link is unique.
+    """
+    toc: List[TocItem] = []
+    used: Set[str] = set()
+    parts: List[str] = []
+    pos = 0
+
+    for match in HEADING_RE.finditer(html_body):
+        level = int(match.group(1))
+        inner = match.group(2)
+        title = html.unescape(TAG_RE.sub('', inner)).strip()
+
+        slug = base_slug = heading_slug(title)
+        suffix = 1
+        while slug in used:
+            slug = f'{base_slug}_{suffix}'
+            suffix += 1
+        used.add(slug)
+
+        parts.append(html_body[pos:match.start()])
+        parts.append(HEADING_HTML(level, slug, inner))
+        toc.append(TocItem(level, title, slug))
+        pos = match.end()
+
+    parts.append(html_body[pos:])
+    return ''.join(parts), toc
+
+
+def generate_sidebar_toc(toc: List[TocItem]) -> str:
+    """
+    Generate HTML sidebar TOC based on extracted TOC
+    """
+    if not toc:
+        return "<p>No table of contents available</p>"
+
+    parts: List[str] = ['<div class="toc-title">Contents</div>\n<ul class="toc-list">\n']
+
+    current_level = 1
+    for item in toc:
+        level = item.level
+
+        # Adjust nesting based on level
+        if level > current_level:
+            # Open nested lists
+            parts.extend([TOC_NESTED_OPEN] * (level - current_level))
+        elif level < current_level:
+            # Close nested lists
+            parts.extend([TOC_NESTED_CLOSE] * (current_level - level))
+
+        # Add list item
+        parts.append(TOC_ITEM_HTML(item.slug, html.escape(item.title, quote=False)))
+
+        current_level = level
+
+    # Close any remaining nested lists
+    parts.extend([TOC_NESTED_CLOSE] * (current_level - 1))
+    parts.append('</li>\n</ul>\n')
+
+    return ''.join(parts)